@@ -1,23 +1,152 @@
+from __future__ import annotations
+
 from argparse import ArgumentParser, Namespace
+from collections.abc import Iterator
+from contextlib import redirect_stdout, suppress
+from functools import lru_cache
+from itertools import islice
 import datetime
+import json
 import os.path
-
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow  # pyright: ignore[reportMissingTypeStubs]
-from googleapiclient.discovery import build  # pyright: ignore[reportUnknownVariableType]
-from googleapiclient.errors import HttpError
+import sys
+from typing import TYPE_CHECKING
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # ciso8601 is optional, the stdlib parser is used without it
+    _parse_iso = datetime.datetime.fromisoformat
+
+# The Google SDK pulls in a large import graph, so it is imported inside the
+# functions that need it and commands like --help start quickly.
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.errors import HttpError
+    import httplib2
+    import socket
 
 # If modifying these scopes, delete the file token.json.
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
+# Separator line printed between entries.
+SEP = "_" * 80
+
+# Unit for the events --timeout window.
+DAY = datetime.timedelta(days=1)
+
+# Unix socket a running `daemon` listens on.
+CACHE_DIR = os.path.expanduser("~/.cache/calendar-cli")
+SOCKET_PATH = os.path.join(CACHE_DIR, "sock")
+
+# Seconds either side of the daemon socket waits on the other.
+DAEMON_TIMEOUT = 120
+
+# Google accepts at most 50 calls in a single batch request.
+BATCH_SIZE = 50
+
+# Parallel fetches are kept low to stay clear of rateLimitExceeded errors.
+MAX_WORKERS = 5
+
+# Connections kept open by the shared HTTP session, enough for every worker.
+POOL_SIZE = 10
+
+# The Calendar API returns at most 250 events per page.
+PAGE_SIZE = 250
+
+
+class _OrjsonModule:
+    """Drop-in for the json module used by googleapiclient, backed by orjson.
+
+    googleapiclient only calls loads() and dumps() with default arguments, so
+    orjson's lack of options like indent= does not matter there. Anything else
+    (such as json.decoder.JSONDecodeError) is taken from the stdlib module;
+    orjson's own decode error subclasses it.
+    """
+
+    def __init__(self, orjson) -> None:
+        self._orjson = orjson
+
+    def loads(self, content: str | bytes):
+        return self._orjson.loads(content)
+
+    def dumps(self, value) -> str:
+        return self._orjson.dumps(value).decode()
+
+    def __getattr__(self, name: str):
+        return getattr(json, name)
+
+
+def _use_orjson() -> None:
+    """Parses the discovery document and API responses with orjson if installed."""
+    try:
+        import orjson
+    except ImportError:  # orjson is optional, the stdlib json module is used without it
+        return
+
+    import googleapiclient.discovery
+    import googleapiclient.model
+
+    googleapiclient.discovery.json = _OrjsonModule(orjson)
+    googleapiclient.model.json = _OrjsonModule(orjson)
+
+
+def _write_private(path: str, data: bytes) -> None:
+    """Replaces path with data in one step, readable only by the current user.
+
+    Writing a temporary file and renaming it means a failed write never leaves
+    path truncated; creating it with mode 0600 keeps secrets like the refresh
+    token away from other local users.
+    """
+    tmp_path = path + ".tmp"
+    with suppress(FileNotFoundError):
+        os.remove(tmp_path)
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_path, flags, 0o600)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _save_token(creds: Credentials) -> None:
+    """Writes the credentials to token.json unless it already holds them."""
+    new_token = creds.to_json()
+
+    try:
+        with open("token.json") as token:
+            if token.read() == new_token:
+                return
+    except OSError:
+        pass
+
+    _write_private("token.json", new_token.encode())
+
+
+@lru_cache(maxsize=4)
+def _load_creds(path: str, mtime: float) -> Credentials:
+    """Loads the stored credentials once per version of the token file.
+
+    mtime is only part of the cache key, so a rewritten token is read again.
+    """
+    from google.oauth2.credentials import Credentials
+
+    return Credentials.from_authorized_user_file(path, SCOPES)  # pyright: ignore[reportUnknownMemberType]
+
 
 def sign_in() -> Credentials:
     """Sign the user to the Google Calendar API."""
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow  # pyright: ignore[reportMissingTypeStubs]
+
     creds: Credentials | None = None
 
     if os.path.exists("token.json"):
-        creds = Credentials.from_authorized_user_file("token.json", SCOPES)  # pyright: ignore[reportUnknownMemberType]
+        creds = _load_creds("token.json", os.path.getmtime("token.json"))
 
     # If there are no (valid) credentials available, let the user log in.
     if not creds or not creds.valid:
@@ -29,33 +158,146 @@ def sign_in() -> Credentials:
             creds = flow.run_local_server(port=0)
 
         # Save the credentials for the next run
-        with open("token.json", "w") as token:
-            token.write(creds.to_json())
+        _save_token(creds)
 
     return creds
 
 
+class _SessionHttp:
+    """httplib2.Http look-alike that sends requests through a pooled session.
+
+    googleapiclient only calls request() and close() on its transport, and
+    reads .credentials to authorize batch requests. Unlike httplib2.Http the
+    session keeps connections alive between requests and may be shared by
+    threads. Since googleapiclient's own retries are not used here, transient
+    server errors are retried by urllib3 instead.
+    """
+
+    def __init__(self, creds: Credentials) -> None:
+        from google.auth.transport.requests import AuthorizedSession
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self.credentials = creds
+        self.session = AuthorizedSession(creds)
+
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: str | bytes | None = None,
+        headers: dict[str, str] | None = None,
+        **kwargs,
+    ) -> tuple[httplib2.Response, bytes]:
+        import httplib2
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        response = self.session.request(method, uri, data=body, headers=headers)
+
+        info = dict(response.headers)
+        info["status"] = str(response.status_code)
+        resp = httplib2.Response(info)
+        resp.reason = response.reason
+        return resp, response.content
+
+    def close(self) -> None:
+        self.session.close()
+
+
+@lru_cache(maxsize=1)
+def _get_service(creds: Credentials):
+    """Builds the Calendar service once and reuses it for the same credentials."""
+    from googleapiclient.discovery import build  # pyright: ignore[reportUnknownVariableType]
+
+    _use_orjson()
+
+    # static_discovery reads the document bundled with the library, so this
+    # needs no network round-trip and works offline
+    return build("calendar", "v3", http=_SessionHttp(creds), static_discovery=True)
+
+
+def _iter_calendars(service, fields: str) -> Iterator[dict]:
+    """Yields every calendar linked to this user, following nextPageToken."""
+    request = service.calendarList().list(fields=f"items({fields}),nextPageToken")
+    while request is not None:
+        calendar_list = request.execute()
+        yield from calendar_list.get("items", [])
+        request = service.calendarList().list_next(request, calendar_list)
+
+
 def calendars(creds: Credentials, args: Namespace) -> None:
     """prints the calendar ids that is linked to this user"""
-    service = build("calendar", "v3", credentials=creds)
-    calendar_list = service.calendarList().list().execute()
+    service = _get_service(creds)
+    calendar_list = list(_iter_calendars(service, "id,summary"))
 
     if args.verbose:
-        print(f"Found {len(calendar_list['items'])} calendar(s)\n")
+        print(f"Found {len(calendar_list)} calendar(s)\n")
 
-    for calendar in calendar_list["items"]:
+    for calendar in calendar_list:
         calendar_id = calendar.get("id", "")
         summary = calendar.get("summary", "")
-        print("_" * 80)
+        print(SEP)
         print(f"👨{summary}\n🗓️{calendar_id}")
 
-    print("_" * 80)
+    print(SEP)
+
+
+def _split_iso(value: str) -> tuple[str, str]:
+    """Splits an RFC 3339 timestamp into its date and HH:MM parts."""
+    # Google returns a fixed layout (YYYY-MM-DDTHH:MM:SS+HH:MM), so slice it
+    if len(value) >= 16 and value[10] == "T" and value[13] == ":":
+        return value[:10], value[11:16]
+
+    parsed = _parse_iso(value)
+    return parsed.date().isoformat(), parsed.strftime("%H:%M")
+
+
+def _iter_pages(service, request, limit: int) -> Iterator[list[dict]]:
+    """Yields the events of a list request page by page, up to limit events."""
+    while request is not None and limit > 0:
+        page = request.execute()
+        items = page.get("items", [])[:limit]
+        limit -= len(items)
+        yield items
+        request = service.events().list_next(request, page)
+
+
+def _format_event(event: dict) -> str:
+    """Formats a listed event as its block of output lines."""
+    date = event["start"].get("date")
+    start = event["start"].get("dateTime", event["start"].get("date"))
+    end = event["end"].get("dateTime", event["end"].get("date"))
+    summary = event.get("summary", "(No title)")
+
+    if date == None:
+        date, start_time = _split_iso(start)
+        _, end_time = _split_iso(end)
+        return f"{SEP}\n📅Date: {date}\n⏰Time: {start_time}-{end_time}\n📝Summary: {summary}\n"
+
+    return f"{SEP}\n📅Date: {date}\n⏰All Day Event\n📝Summary: {summary}\n"
 
 
 def events(creds: Credentials, args: Namespace) -> None:
     """Prints the events in the specified calendar."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from googleapiclient.errors import HttpError
+
     try:
-        service = build("calendar", "v3", credentials=creds)
+        service = _get_service(creds)
 
         # Determine the start time based on args
         if args.date:
@@ -67,7 +309,7 @@ def events(creds: Credentials, args: Namespace) -> None:
             start_date = datetime.datetime.now(tz=datetime.timezone.utc)
 
         # Calculate end time based on timeout
-        end_date = start_date + datetime.timedelta(days=args.timeout)
+        end_date = start_date + DAY * args.timeout
 
         time_min = start_date.isoformat()
         time_max = end_date.isoformat()
@@ -75,27 +317,46 @@ def events(creds: Credentials, args: Namespace) -> None:
         calendar_id = args.calendar
         max_results = args.number
 
+        # Gather the calendars to fetch from
+        if args.all:
+            calendar_ids = [
+                calendar["id"] for calendar in _iter_calendars(service, "id")
+            ]
+
+        else:
+            calendar_ids = [calendar_id]
+
         if args.verbose:
-            print(f"Fetching {max_results} events from calendar '{calendar_id}'")
+            if args.all:
+                print(
+                    f"Fetching {max_results} events from each of {len(calendar_ids)} calendar(s)"
+                )
+            else:
+                print(f"Fetching {max_results} events from calendar '{calendar_id}'")
             print(f"Time range: {time_min} to {time_max}")
 
-        events_result = (
-            service.events()
-            .list(
+        def fetch(calendar_id: str) -> Iterator[list[dict]]:
+            request = service.events().list(
                 calendarId=calendar_id,
                 timeMin=time_min,
                 timeMax=time_max,
-                maxResults=max_results,
+                maxResults=min(max_results, PAGE_SIZE),
                 singleEvents=True,
                 orderBy="startTime",
+                fields="items(start(date,dateTime),end(date,dateTime),summary),nextPageToken",
             )
-            .execute()
-        )
-        events = events_result.get("items", [])
+            return _iter_pages(service, request, max_results)
 
-        if not events:
-            print("No upcoming events found.")
-            return
+        def fetch_in_thread(calendar_id: str) -> list[list[dict]]:
+            # Read every page inside the worker, sharing the pooled session
+            return list(fetch(calendar_id))
+
+        if len(calendar_ids) == 1:
+            # Stream the pages so the first events print as soon as they arrive
+            results = [fetch(calendar_ids[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                results = list(executor.map(fetch_in_thread, calendar_ids))
 
         # for event in events:
         #     from pprint import pprint
@@ -104,100 +365,156 @@ def events(creds: Credentials, args: Namespace) -> None:
         # return
 
         # Prints the start, end, and name of the events
-        for event in events:
-            date = event["start"].get("date")
-            start = event["start"].get("dateTime", event["start"].get("date"))
-            end = event["end"].get("dateTime", event["end"].get("date"))
-            summary = event.get("summary", "(No title)")
-
-            if date == None:
-                start_dt = datetime.datetime.fromisoformat(start)
-                end_dt = datetime.datetime.fromisoformat(end)
-                date = start_dt.date()
-                print("_" * 80)
-                print(f"📅Date: {date}")
-                print(
-                    f"⏰Time: {start_dt.strftime('%H:%M')}-{end_dt.strftime('%H:%M')}"
-                )
-                print(f"📝Summary: {summary}")
-                
-                continue
-
-            print("_" * 80)
-            print(f"📅Date: {date}")
-            print(f"⏰All Day Event")
-            print(f"📝Summary: {summary}")
+        total = 0
+        for calendar_id, pages in zip(calendar_ids, results):
+            header = f"{SEP}\n🗓️{calendar_id}\n" if args.all else ""
+            for page in pages:
+                if not page:
+                    continue
+
+                # Format a whole page at once and write it with a single call
+                sys.stdout.write(header + "".join(map(_format_event, page)))
+                header = ""
+                total += len(page)
+
+        if not total:
+            print("No upcoming events found.")
+            return
 
-        print("_" * 80)
-        print(f"\nTotal events: {len(events)}")
+        sys.stdout.write(f"{SEP}\n\nTotal events: {total}\n")
 
     except HttpError as error:
         print(f"An error occurred: {error}")
 
 
+def _print_created(request_id: str | None, event: dict, error: HttpError | None) -> None:
+    """Prints the outcome of a single event insertion."""
+    print(SEP)
+    if error is not None:
+        print(f"An error occurred: {error}")
+        return
+
+    print("✅ Event created successfully!")
+    print(f"📝 Summary: {event.get('summary')}")
+    print(f"🆔 Event ID: {event.get('id')}")
+    print(f"🔗 Link: {event.get('htmlLink')}")
+
+
 def new_event(creds: Credentials, args: Namespace) -> None:
-    """Create a new event in the user's calendar."""
+    """Create new events in the user's calendar."""
+    from googleapiclient.errors import HttpError
+
     try:
-        service = build("calendar", "v3", credentials=creds)
+        service = _get_service(creds)
         calendar_id = args.calendar
 
-        # Parse start time (default to now if not provided)
-        if args.start:
-            start_time = datetime.datetime.fromisoformat(args.start)
-            if start_time.tzinfo is None:
-                start_time = start_time.replace(tzinfo=datetime.timezone.utc)
-        else:
-            start_time = datetime.datetime.now(tz=datetime.timezone.utc)
+        if args.from_file:
+            # Read ready-made event bodies (a single event or a list of them)
+            try:
+                with open(args.from_file) as file:
+                    event_bodies = json.load(file)
+            except (OSError, ValueError) as error:
+                print(f"Error reading events file: {error}")
+                return
+
+            if isinstance(event_bodies, dict):
+                event_bodies = [event_bodies]
+
+            if not isinstance(event_bodies, list) or not all(
+                isinstance(event_body, dict) for event_body in event_bodies
+            ):
+                print("Error reading events file: expected an event or a list of events")
+                return
+
+            if not event_bodies:
+                print(f"No events found in '{args.from_file}'.")
+                return
+
+            if args.verbose:
+                print(
+                    f"Creating {len(event_bodies)} event(s) from '{args.from_file}' in calendar '{calendar_id}'"
+                )
 
-        # Parse end time (default to 1 hour after start if not provided)
-        if args.end:
-            end_time = datetime.datetime.fromisoformat(args.end)
-            if end_time.tzinfo is None:
-                end_time = end_time.replace(tzinfo=datetime.timezone.utc)
         else:
-            end_time = start_time + datetime.timedelta(hours=1)
-
-        # Build the event body
-        event_body = {
-            "summary": args.summary,
-            "start": {
-                "dateTime": start_time.isoformat(),
-                "timeZone": "UTC",
-            },
-            "end": {
-                "dateTime": end_time.isoformat(),
-                "timeZone": "UTC",
-            },
-        }
-
-        # Add optional fields if provided
-        if args.location:
-            event_body["location"] = args.location
-
-        if args.description:
-            event_body["description"] = args.description
-
-        if args.verbose:
-            print(f"Creating event in calendar '{calendar_id}'")
-            print(f"Summary: {args.summary}")
-            print(f"Start: {start_time.isoformat()}")
-            print(f"End: {end_time.isoformat()}")
-            if args.location:
-                print(f"Location: {args.location}")
-            if args.description:
-                print(f"Description: {args.description}")
-
-        # Create the event
-        event = (
-            service.events().insert(calendarId=calendar_id, body=event_body).execute()
-        )
+            # Parse start time (default to now if not provided)
+            if args.start:
+                start_time = datetime.datetime.fromisoformat(args.start)
+                if start_time.tzinfo is None:
+                    start_time = start_time.replace(tzinfo=datetime.timezone.utc)
+            else:
+                start_time = datetime.datetime.now(tz=datetime.timezone.utc)
+
+            # Parse end time (default to 1 hour after start if not provided)
+            if args.end:
+                end_time = datetime.datetime.fromisoformat(args.end)
+                if end_time.tzinfo is None:
+                    end_time = end_time.replace(tzinfo=datetime.timezone.utc)
+            else:
+                end_time = start_time + datetime.timedelta(hours=1)
+
+            # Build one event body per summary
+            event_bodies = []
+            for summary in args.summary:
+                event_body = {
+                    "summary": summary,
+                    "start": {
+                        "dateTime": start_time.isoformat(),
+                        "timeZone": "UTC",
+                    },
+                    "end": {
+                        "dateTime": end_time.isoformat(),
+                        "timeZone": "UTC",
+                    },
+                }
+
+                # Add optional fields if provided
+                if args.location:
+                    event_body["location"] = args.location
+
+                if args.description:
+                    event_body["description"] = args.description
+
+                event_bodies.append(event_body)
+
+            if args.verbose:
+                print(f"Creating event in calendar '{calendar_id}'")
+                print(f"Summary: {', '.join(args.summary)}")
+                print(f"Start: {start_time.isoformat()}")
+                print(f"End: {end_time.isoformat()}")
+                if args.location:
+                    print(f"Location: {args.location}")
+                if args.description:
+                    print(f"Description: {args.description}")
+
+        if len(event_bodies) == 1:
+            # Create the event
+            event = (
+                service.events()
+                .insert(
+                    calendarId=calendar_id,
+                    body=event_bodies[0],
+                    fields="id,summary,htmlLink",
+                )
+                .execute()
+            )
+            _print_created(None, event, None)
 
-        print("_" * 80)
-        print("✅ Event created successfully!")
-        print(f"📝 Summary: {event.get('summary')}")
-        print(f"🆔 Event ID: {event.get('id')}")
-        print(f"🔗 Link: {event.get('htmlLink')}")
-        print("_" * 80)
+        else:
+            # Send the events as batches of at most BATCH_SIZE requests
+            pending = iter(event_bodies)
+            while chunk := list(islice(pending, BATCH_SIZE)):
+                batch = service.new_batch_http_request(callback=_print_created)
+                for event_body in chunk:
+                    batch.add(
+                        service.events().insert(
+                            calendarId=calendar_id,
+                            body=event_body,
+                            fields="id,summary,htmlLink",
+                        )
+                    )
+                batch.execute()
+
+        print(SEP)
 
     except ValueError as error:
         print(f"Error parsing date/time: {error}")
@@ -208,12 +525,150 @@ def new_event(creds: Credentials, args: Namespace) -> None:
         print(f"An error occurred: {error}")
 
 
-def main():
-    """Command-line interface for Google Calendar API.
+# Subcommands that can run in-process or be served by the daemon.
+COMMANDS = {
+    "calendars": calendars,
+    "events": events,
+    "new": new_event,
+}
 
-    This script provides a command-line interface for interacting with the Google Calendar API.
-    It allows users to list events, create events, and manage calendars.
+
+def _recv_all(connection: socket.socket) -> bytes:
+    """Reads from the connection until the other side stops sending."""
+    chunks = []
+    while chunk := connection.recv(65536):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def forward_to_daemon(args: Namespace) -> bool:
+    """Runs the command on a running daemon and prints its output.
+
+    Returns False when no daemon is listening, or when it is signed in with a
+    different token.json, so the caller can run the command in-process instead.
     """
+    import socket
+
+    if not os.path.exists(SOCKET_PATH):
+        return False
+
+    # The daemon runs in its own working directory, so resolve paths here
+    request = {"token": os.path.abspath("token.json"), "args": vars(args)}
+    if getattr(args, "from_file", None):
+        request["args"] = {**vars(args), "from_file": os.path.abspath(args.from_file)}
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(DAEMON_TIMEOUT)
+        try:
+            client.connect(SOCKET_PATH)
+        except OSError:
+            # Stale socket left behind by a daemon that is no longer running
+            return False
+
+        # The command may already have run, so never fall back from here on
+        try:
+            client.sendall(json.dumps(request).encode())
+            client.shutdown(socket.SHUT_WR)
+            data = _recv_all(client)
+        except OSError as error:
+            sys.exit(f"Error talking to the daemon: {error}")
+
+    if not data:
+        sys.exit("Error: the daemon closed the connection without replying")
+
+    try:
+        reply = json.loads(data)
+    except ValueError:
+        sys.exit("Error: the daemon sent an invalid reply")
+
+    if reply["status"] == "refused":
+        return False
+
+    if reply["status"] != "ok":
+        sys.exit(reply["output"].rstrip("\n"))
+
+    sys.stdout.write(reply["output"])
+    return True
+
+
+def _handle_request(creds: Credentials, token_path: str, data: bytes) -> dict:
+    """Runs one forwarded command and returns the daemon's reply to it."""
+    import io
+
+    try:
+        request = json.loads(data)
+        if request["token"] != token_path:
+            # Another account, the client has to sign in and run it itself
+            return {"status": "refused", "output": ""}
+
+        command_args = Namespace(**request["args"])
+        command = COMMANDS[command_args.command]
+    except Exception as error:
+        return {"status": "error", "output": f"Invalid request: {error!r}\n"}
+
+    output = io.StringIO()
+    try:
+        with redirect_stdout(output):
+            command(creds, command_args)
+    except Exception as error:
+        output.write(f"An error occurred: {error}\n")
+        return {"status": "error", "output": output.getvalue()}
+
+    return {"status": "ok", "output": output.getvalue()}
+
+
+def daemon(creds: Credentials, args: Namespace) -> None:
+    """Serves commands from other invocations, keeping the service warm.
+
+    Only clients whose token.json is the one the daemon signed in with are
+    served, so a command never runs against a different account.
+    """
+    import socket
+
+    token_path = os.path.abspath("token.json")
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    if os.path.exists(SOCKET_PATH):
+        os.remove(SOCKET_PATH)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        # Only the current user may talk to the daemon
+        umask = os.umask(0o177)
+        try:
+            server.bind(SOCKET_PATH)
+        finally:
+            os.umask(umask)
+        server.listen()
+
+        if args.verbose:
+            print(f"Listening on {SOCKET_PATH}")
+
+        try:
+            while True:
+                connection, _ = server.accept()
+                with connection:
+                    # A client that hangs up early must not take the daemon
+                    # down for everyone else
+                    connection.settimeout(DAEMON_TIMEOUT)
+                    try:
+                        data = _recv_all(connection)
+                    except OSError as error:
+                        if args.verbose:
+                            print(f"Dropped a request: {error}")
+                        continue
+
+                    reply = _handle_request(creds, token_path, data)
+                    with suppress(OSError):
+                        connection.sendall(json.dumps(reply).encode())
+
+        except KeyboardInterrupt:
+            pass
+
+        finally:
+            os.remove(SOCKET_PATH)
+
+
+def build_parser() -> ArgumentParser:
+    """Builds the command-line parser."""
 
     # Create the main parser
     parser = ArgumentParser(description="Google Calendar CLI Tool")
@@ -262,11 +717,27 @@ def main():
         "--date",
         help="date to start fetching from (default: today)",
     )
+    parser_events.add_argument(
+        "-a",
+        "--all",
+        action="store_true",
+        help="fetch events from every calendar linked to this user",
+    )
 
     # new command
     parser_new = subparsers.add_parser("new", help="Create a new event in the calendar")
-    parser_new.add_argument(
-        "-S", "--summary", required=True, help="event summary/title (required)"
+    new_source = parser_new.add_mutually_exclusive_group(required=True)
+    new_source.add_argument(
+        "-S",
+        "--summary",
+        action="append",
+        help="event summary/title, repeat to create several events",
+    )
+    new_source.add_argument(
+        "-f",
+        "--from-file",
+        metavar="path",
+        help="JSON file with an event body or a list of event bodies (excludes -s/-e/-l/-d)",
     )
     parser_new.add_argument(
         "-s", "--start", help="start time in ISO format (default: now)"
@@ -277,17 +748,40 @@ def main():
     parser_new.add_argument("-l", "--location", help="location for the event")
     parser_new.add_argument("-d", "--description", help="description for the event")
 
+    # daemon command
+    parser_daemon = subparsers.add_parser(
+        "daemon", help="Serve other invocations over a local socket"
+    )
+
+    return parser
+
+
+def main():
+    """Command-line interface for Google Calendar API.
+
+    This script provides a command-line interface for interacting with the Google Calendar API.
+    It allows users to list events, create events, and manage calendars.
+    """
+    parser = build_parser()
+
     # Parse arguments
     args = parser.parse_args()
 
+    # The file's event bodies carry their own times and details
+    if args.command == "new" and args.from_file:
+        if args.start or args.end or args.location or args.description:
+            parser.error("-s/-e/-l/-d cannot be combined with -f/--from-file")
+
+    # Hand the command to a running daemon if there is one
+    if args.command in COMMANDS and forward_to_daemon(args):
+        return
+
     creds = sign_in()
     # Execute the appropriate command
-    if args.command == "calendars":
-        calendars(creds, args)
-    elif args.command == "events":
-        events(creds, args)
-    elif args.command == "new":
-        new_event(creds, args)
+    if args.command in COMMANDS:
+        COMMANDS[args.command](creds, args)
+    elif args.command == "daemon":
+        daemon(creds, args)
     else:
         parser.print_help()
 